@@ -1,12 +1,24 @@
 from __future__ import annotations
 
+import math
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Iterator
+
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
-from mortgage_free_analysis.models import MortgageInputs, ScenarioRange, validate_inputs
-from mortgage_free_analysis.service import MortgageAnalysisService, default_inputs
+from mortgage_free_analysis.models import (
+    MortgageInputs,
+    ScenarioRange,
+    Schedule,
+    validate_inputs,
+    validate_scenario_range,
+)
+from mortgage_free_analysis.service import SWEEP_METRICS, MortgageAnalysisService, default_inputs
 
 
 st.set_page_config(
@@ -18,12 +30,113 @@ st.set_page_config(
 service = MortgageAnalysisService()
 DEFAULT = default_inputs()
 CURRENCY_SYMBOLS = {"USD": "$", "EUR": "EUR ", "GBP": "GBP "}
+NO_BALANCE_MESSAGE = "No mortgage balance to repay. Enter a loan amount to see the schedule."
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_schedule(inputs: MortgageInputs) -> Schedule:
+    return service.schedule_arrays(inputs)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_annual(inputs: MortgageInputs) -> pd.DataFrame:
+    return service.annual_view(cached_schedule(inputs))
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_plan(inputs: MortgageInputs, rate: float, annual_overpayment: float) -> dict[str, float]:
+    result = service.scenario_result(
+        inputs, rate=rate, annual_overpayment=annual_overpayment, want_schedule=False
+    )
+    del result["schedule"]
+    return result
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_sweep(
+    inputs: MortgageInputs,
+    scenario: ScenarioRange,
+    overpayment_levels: tuple[float, ...],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Include the user's own overpayment so the scenario table is a slice of the
+    # same sweep that feeds the heatmap.
+    return service.rate_overpay_sweep(
+        inputs, scenario, [*overpayment_levels, inputs.annual_overpayment]
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_scenarios(
+    inputs: MortgageInputs,
+    scenario: ScenarioRange,
+    overpayment_levels: tuple[float, ...],
+) -> pd.DataFrame:
+    sweep = cached_sweep(inputs, scenario, overpayment_levels)
+    return service.scenario_slice(sweep, inputs.annual_overpayment)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_heatmap(
+    inputs: MortgageInputs,
+    scenario: ScenarioRange,
+    overpayment_levels: tuple[float, ...],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    overpayments, rates, metrics = cached_sweep(inputs, scenario, overpayment_levels)
+    shown = np.isin(overpayments, overpayment_levels)
+    years = metrics[SWEEP_METRICS.index("years")]
+    return overpayments[shown], rates, years[shown]
+
+
+@contextmanager
+def report_input_errors() -> Iterator[None]:
+    # Streamlit handles exceptions raised inside a fragment itself, so the
+    # page-level ValueError handler never sees them; fragments report their own.
+    try:
+        yield
+    except ValueError as exc:
+        st.error(f"Input validation error: {exc}")
 
 
 def money(value: float, currency_symbol: str) -> str:
     return f"{currency_symbol}{value:,.0f}"
 
 
+def number_columns(
+    currency_symbol: str, currency: list[str], plain: dict[str, str] | None = None
+) -> dict[str, st.column_config.NumberColumn]:
+    # Formatting happens client-side, so the columns stay numeric and sort by
+    # value. The printf formats st.dataframe supports have no thousands separator.
+    config = {
+        name: st.column_config.NumberColumn(format=f"{currency_symbol}%.0f") for name in currency
+    }
+    for name, pattern in (plain or {}).items():
+        config[name] = st.column_config.NumberColumn(format=pattern)
+    return config
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _parse_overpay_levels(text: str) -> tuple[list[float], list[str]]:
+    values: list[float] = []
+    warnings: list[str] = []
+    for item in text.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            value = float(item)
+        except ValueError:
+            value = math.nan
+        # Negative or non-finite levels would fail validation for the whole sweep.
+        if math.isfinite(value) and value >= 0:
+            values.append(value)
+        else:
+            warnings.append(f"Ignoring invalid overpayment value: {item}")
+
+    if not values:
+        values = [0.0, 3000.0, 6000.0]
+    return values, warnings
+
+
 def render_sidebar() -> tuple[MortgageInputs, ScenarioRange, list[float], bool, str]:
     with st.sidebar:
         currency_code = st.selectbox(
@@ -146,18 +259,9 @@ def render_sidebar() -> tuple[MortgageInputs, ScenarioRange, list[float], bool,
             help="Example: 0, 5000, 10000",
         )
 
-        parsed_overpayments: list[float] = []
-        for item in custom_overpay_levels.split(","):
-            item = item.strip()
-            if not item:
-                continue
-            try:
-                parsed_overpayments.append(float(item))
-            except ValueError:
-                st.warning(f"Ignoring invalid overpayment value: {item}")
-
-        if not parsed_overpayments:
-            parsed_overpayments = [0.0, 3000.0, 6000.0]
+        parsed_overpayments, parse_warnings = _parse_overpay_levels(custom_overpay_levels)
+        for message in parse_warnings:
+            st.warning(message)
 
         inputs = MortgageInputs(
             property_value=property_value,
@@ -209,93 +313,169 @@ def kpi_row(
     )
 
 
-def render_dashboard(inputs: MortgageInputs, schedule: pd.DataFrame, annual: pd.DataFrame) -> None:
+@st.cache_resource(max_entries=32)
+def build_dashboard_figures(
+    inputs: MortgageInputs,
+) -> tuple[go.Figure, go.Figure, go.Figure, go.Figure]:
+    schedule = cached_schedule(inputs)
+    annual = cached_annual(inputs)
+
+    # Charts only need display precision; float32 halves the JSON Plotly ships.
+    chart_balance = px.line(
+        x=schedule.month,
+        y=schedule.balance.astype(np.float32),
+        title="Mortgage Balance Over Time",
+        labels={"x": "Month", "y": "Balance"},
+    )
+    chart_balance.update_layout(height=380)
+
+    annual_chart = annual.astype(
+        {
+            "Annual Interest": np.float32,
+            "Annual Principal": np.float32,
+            "Annual Overpayment": np.float32,
+            "Ending Balance": np.float32,
+        }
+    )
+    annual_melt = annual_chart.melt(
+        id_vars="Year",
+        value_vars=["Annual Interest", "Annual Principal", "Annual Overpayment"],
+        var_name="Component",
+        value_name="Amount",
+    )
+    stacked = px.area(
+        annual_melt,
+        x="Year",
+        y="Amount",
+        color="Component",
+        title="Yearly Cashflow Composition",
+    )
+    stacked.update_layout(height=360)
+
+    totals = schedule.totals
+    years = totals.months / 12
+    total_insurance = inputs.annual_insurance * years
+    recurring_fee = inputs.annual_ground_rent * years
+
+    sankey = go.Figure(
+        data=[
+            go.Sankey(
+                node={
+                    "pad": 15,
+                    "thickness": 16,
+                    "label": [
+                        "Total Outflow",
+                        "Principal",
+                        "Interest",
+                        "Overpayment",
+                        "Insurance",
+                        "Recurring Fee",
+                    ],
+                },
+                link={
+                    "source": [0, 0, 0, 0, 0],
+                    "target": [1, 2, 3, 4, 5],
+                    "value": [
+                        totals.principal,
+                        totals.interest,
+                        totals.overpayment,
+                        total_insurance,
+                        recurring_fee,
+                    ],
+                },
+            )
+        ]
+    )
+    sankey.update_layout(title_text="Where Your Money Goes", height=420)
+
+    payoff = px.bar(
+        annual_chart,
+        x="Year",
+        y="Ending Balance",
+        title="Remaining Balance by Year",
+        labels={"Ending Balance": "Balance"},
+    )
+    payoff.update_layout(height=320)
+
+    return chart_balance, stacked, sankey, payoff
+
+
+@st.fragment
+@report_input_errors()
+def render_dashboard(inputs: MortgageInputs) -> None:
+    if len(cached_schedule(inputs)) == 0:
+        st.info(NO_BALANCE_MESSAGE)
+        return
+
+    chart_balance, stacked, sankey, payoff = build_dashboard_figures(inputs)
     left, right = st.columns([1.35, 1.0])
 
     with left:
-        chart_balance = px.line(
-            schedule,
-            x="Month",
-            y="Ending Balance",
-            title="Mortgage Balance Over Time",
-            labels={"Ending Balance": "Balance"},
-        )
-        chart_balance.update_layout(height=380)
         st.plotly_chart(chart_balance, width="stretch")
-
-        annual_melt = annual.melt(
-            id_vars="Year",
-            value_vars=["Annual Interest", "Annual Principal", "Annual Overpayment"],
-            var_name="Component",
-            value_name="Amount",
-        )
-        stacked = px.area(
-            annual_melt,
-            x="Year",
-            y="Amount",
-            color="Component",
-            title="Yearly Cashflow Composition",
-        )
-        stacked.update_layout(height=360)
         st.plotly_chart(stacked, width="stretch")
 
     with right:
-        total_principal = float(schedule["Principal"].sum())
-        total_interest = float(schedule["Interest"].sum())
-        total_overpaid = float(schedule["Overpayment"].sum())
-
-        years = float(schedule["Month"].max()) / 12
-        total_insurance = inputs.annual_insurance * years
-        recurring_fee = inputs.annual_ground_rent * years
-
-        sankey = go.Figure(
-            data=[
-                go.Sankey(
-                    node={
-                        "pad": 15,
-                        "thickness": 16,
-                        "label": [
-                            "Total Outflow",
-                            "Principal",
-                            "Interest",
-                            "Overpayment",
-                            "Insurance",
-                            "Recurring Fee",
-                        ],
-                    },
-                    link={
-                        "source": [0, 0, 0, 0, 0],
-                        "target": [1, 2, 3, 4, 5],
-                        "value": [
-                            total_principal,
-                            total_interest,
-                            total_overpaid,
-                            total_insurance,
-                            recurring_fee,
-                        ],
-                    },
-                )
-            ]
-        )
-        sankey.update_layout(title_text="Where Your Money Goes", height=420)
         st.plotly_chart(sankey, width="stretch")
-
-        yearly_balance = schedule.groupby("Year", as_index=False)["Ending Balance"].last()
-        payoff = px.bar(
-            yearly_balance,
-            x="Year",
-            y="Ending Balance",
-            title="Remaining Balance by Year",
-            labels={"Ending Balance": "Balance"},
-        )
-        payoff.update_layout(height=320)
         st.plotly_chart(payoff, width="stretch")
 
 
+@st.cache_resource(max_entries=32)
+def build_scenario_figures(
+    inputs: MortgageInputs,
+    scenario: ScenarioRange,
+    overpayment_levels: tuple[float, ...],
+) -> tuple[go.Figure, go.Figure]:
+    scenarios = cached_scenarios(inputs, scenario, overpayment_levels)
+
+    chart_interest = px.line(
+        scenarios,
+        x="Rate %",
+        y="Total Interest",
+        markers=True,
+        title="Total Interest vs Rate",
+    )
+    chart_interest.update_layout(height=350)
+
+    chart_years = px.line(
+        scenarios,
+        x="Rate %",
+        y="Mortgage-Free in Years",
+        markers=True,
+        title="Payoff Time vs Rate",
+    )
+    chart_years.update_layout(height=350)
+
+    return chart_interest, chart_years
+
+
+@st.cache_resource(max_entries=32)
+def build_heatmap_figure(
+    inputs: MortgageInputs,
+    scenario: ScenarioRange,
+    overpayment_levels: tuple[float, ...],
+) -> go.Figure:
+    overpayments, rates, years = cached_heatmap(inputs, scenario, overpayment_levels)
+
+    heatmap = px.imshow(
+        years,
+        x=rates,
+        y=overpayments,
+        labels={"x": "Rate %", "y": "Annual Overpayment", "color": "Years"},
+        text_auto=True,
+        title="Mortgage-Free Years Heatmap",
+        aspect="auto",
+    )
+    heatmap.update_traces(texttemplate="%{z:.1f}")
+    heatmap.update_layout(height=420)
+    return heatmap
+
+
+@st.fragment
+@report_input_errors()
 def render_scenario_lab(
     inputs: MortgageInputs,
     scenario: ScenarioRange,
-    overpayment_levels: list[float],
+    overpayment_levels: tuple[float, ...],
     currency_symbol: str,
 ) -> None:
     st.subheader("Scenario Lab")
@@ -303,65 +483,41 @@ def render_scenario_lab(
         "Use this to test rate changes while keeping all other assumptions fixed."
     )
 
-    scenarios = service.scenario_analysis(inputs, scenario)
-    currency_fmt = f"{currency_symbol}" + "{:,.0f}"
     st.dataframe(
-        scenarios.style.format(
-            {
-                "Rate %": "{:.2f}",
-                "Monthly Payment (before overpay)": currency_fmt,
-                "Mortgage-Free in Years": "{:.2f}",
-                "Mortgage-Free in Months": "{:,.0f}",
-                "Total Interest": currency_fmt,
-                "Total Paid to Lender": currency_fmt,
-                "All-in Cost": currency_fmt,
-            }
-        ),
+        cached_scenarios(inputs, scenario, overpayment_levels),
         width="stretch",
         hide_index=True,
+        column_config=number_columns(
+            currency_symbol,
+            [
+                "Monthly Payment (before overpay)",
+                "Total Interest",
+                "Total Paid to Lender",
+                "All-in Cost",
+            ],
+            {
+                "Rate %": "%.2f",
+                "Mortgage-Free in Years": "%.2f",
+                "Mortgage-Free in Months": "%d",
+            },
+        ),
     )
 
+    chart_interest, chart_years = build_scenario_figures(inputs, scenario, overpayment_levels)
     p1, p2 = st.columns(2)
     with p1:
-        chart_interest = px.line(
-            scenarios,
-            x="Rate %",
-            y="Total Interest",
-            markers=True,
-            title="Total Interest vs Rate",
-        )
-        chart_interest.update_layout(height=350)
         st.plotly_chart(chart_interest, width="stretch")
 
     with p2:
-        chart_years = px.line(
-            scenarios,
-            x="Rate %",
-            y="Mortgage-Free in Years",
-            markers=True,
-            title="Payoff Time vs Rate",
-        )
-        chart_years.update_layout(height=350)
         st.plotly_chart(chart_years, width="stretch")
 
     st.markdown("### Overpayment + Rate Grid")
-    heatmap_df = service.build_heatmap_data(inputs, scenario, overpayment_levels)
-    heatmap_table = heatmap_df.pivot(
-        index="Annual Overpayment", columns="Rate %", values="Mortgage-Free in Years"
-    )
-
-    heatmap = px.imshow(
-        heatmap_table,
-        labels={"x": "Rate %", "y": "Annual Overpayment", "color": "Years"},
-        text_auto=True,
-        title="Mortgage-Free Years Heatmap",
-        aspect="auto",
-    )
-    heatmap.update_traces(texttemplate="%{z:.1f}")
-    heatmap.update_layout(height=420)
+    heatmap = build_heatmap_figure(inputs, scenario, overpayment_levels)
     st.plotly_chart(heatmap, width="stretch")
 
 
+@st.fragment
+@report_input_errors()
 def render_plan_comparison(inputs: MortgageInputs, currency_symbol: str) -> None:
     st.subheader("Compare Two Plans")
     st.caption("Plan A and Plan B apply to the same principal and term.")
@@ -407,8 +563,8 @@ def render_plan_comparison(inputs: MortgageInputs, currency_symbol: str) -> None
             key="overpay_b",
         )
 
-    plan_a = service.scenario_result(inputs, rate=float(rate_a), annual_overpayment=float(overpay_a))
-    plan_b = service.scenario_result(inputs, rate=float(rate_b), annual_overpayment=float(overpay_b))
+    plan_a = cached_plan(inputs, float(rate_a), float(overpay_a))
+    plan_b = cached_plan(inputs, float(rate_b), float(overpay_b))
 
     m1, m2, m3, m4 = st.columns(4)
     m1.metric("A: Mortgage-free", f"{plan_a['years']:.2f} yrs")
@@ -456,73 +612,80 @@ def render_plan_comparison(inputs: MortgageInputs, currency_symbol: str) -> None
         "Total Paid to Lender",
         "All-in Cost",
     }
+    is_currency = compare_display["Metric"].isin(currency_metrics).to_numpy()
     for col in ["Plan A", "Plan B", "Difference (A-B)"]:
-        compare_display[col] = compare_display.apply(
-            lambda row: (
-                money(float(row[col]), currency_symbol)
-                if row["Metric"] in currency_metrics
-                else f"{float(row[col]):.2f}"
-            ),
-            axis=1,
-        )
+        values = compare_df[col].to_numpy(dtype=float)
+        formatted = np.empty(len(values), dtype=object)
+        formatted[is_currency] = [money(v, currency_symbol) for v in values[is_currency]]
+        formatted[~is_currency] = [f"{v:.2f}" for v in values[~is_currency]]
+        compare_display[col] = formatted
 
     st.dataframe(compare_display, width="stretch", hide_index=True)
 
 
-def render_cashflow(
-    schedule: pd.DataFrame,
-    annual: pd.DataFrame,
-    currency_symbol: str,
-) -> None:
+@st.cache_data(show_spinner=False, max_entries=64)
+def first_months_table(inputs: MortgageInputs) -> pd.DataFrame:
+    first_months = cached_schedule(inputs).head(24)
+    return pd.DataFrame(
+        {
+            "Month": first_months.month,
+            "Payment": first_months.payment,
+            "Interest": first_months.interest,
+            "Principal": first_months.principal,
+            "Overpayment": first_months.overpayment,
+            "Ending Balance": first_months.balance,
+        }
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def annual_csv_bytes(inputs: MortgageInputs) -> bytes:
+    return cached_annual(inputs).to_csv(index=False).encode("utf-8")
+
+
+@st.fragment
+@report_input_errors()
+def render_cashflow(inputs: MortgageInputs, currency_symbol: str) -> None:
     st.subheader("Cashflow Tables")
+    if len(cached_schedule(inputs)) == 0:
+        st.info(NO_BALANCE_MESSAGE)
+        return
+
     left, right = st.columns([1.2, 1.0])
 
     with left:
         st.markdown("**Year-by-Year Breakdown**")
-        currency_fmt = f"{currency_symbol}" + "{:,.0f}"
         st.dataframe(
-            annual.style.format(
-                {
-                    "Annual Payment": currency_fmt,
-                    "Annual Interest": currency_fmt,
-                    "Annual Principal": currency_fmt,
-                    "Annual Overpayment": currency_fmt,
-                    "Ending Balance": currency_fmt,
-                }
-            ),
+            cached_annual(inputs),
             width="stretch",
             hide_index=True,
+            column_config=number_columns(
+                currency_symbol,
+                [
+                    "Annual Payment",
+                    "Annual Interest",
+                    "Annual Principal",
+                    "Annual Overpayment",
+                    "Ending Balance",
+                ],
+            ),
         )
 
     with right:
         st.markdown("**First 24 Months**")
         st.dataframe(
-            schedule.head(24)[
-                [
-                    "Month",
-                    "Payment",
-                    "Interest",
-                    "Principal",
-                    "Overpayment",
-                    "Ending Balance",
-                ]
-            ].style.format(
-                {
-                    "Payment": currency_fmt,
-                    "Interest": currency_fmt,
-                    "Principal": currency_fmt,
-                    "Overpayment": currency_fmt,
-                    "Ending Balance": currency_fmt,
-                }
-            ),
+            first_months_table(inputs),
             width="stretch",
             hide_index=True,
+            column_config=number_columns(
+                currency_symbol,
+                ["Payment", "Interest", "Principal", "Overpayment", "Ending Balance"],
+            ),
         )
 
-    annual_csv = annual.to_csv(index=False).encode("utf-8")
     st.download_button(
         label="Download annual cashflow CSV",
-        data=annual_csv,
+        data=annual_csv_bytes(inputs),
         file_name="annual_cashflow.csv",
         mime="text/csv",
         help="Exports only generated scenario data, never browser/session metadata.",
@@ -547,32 +710,24 @@ inputs, scenario, overpayment_levels, _, currency_symbol = render_sidebar()
 
 try:
     inputs = validate_inputs(inputs)
-    scenario = ScenarioRange(
-        low_rate=min(scenario.low_rate, scenario.high_rate),
-        high_rate=max(scenario.low_rate, scenario.high_rate),
-        step=scenario.step,
-    )
+    scenario = validate_scenario_range(scenario)
 
-    schedule = service.amortization_schedule(inputs)
+    schedule = cached_schedule(inputs)
     summary = service.summarize_schedule(
         schedule,
         annual_costs=inputs.annual_insurance + inputs.annual_ground_rent,
     )
 
-    no_overpay_inputs = MortgageInputs(
-        property_value=inputs.property_value,
-        loan_amount=inputs.loan_amount,
-        annual_rate_percent=inputs.annual_rate_percent,
-        term_years=inputs.term_years,
-        annual_insurance=inputs.annual_insurance,
-        annual_ground_rent=inputs.annual_ground_rent,
-        annual_overpayment=0.0,
-    )
-    baseline_schedule = service.amortization_schedule(no_overpay_inputs)
-    baseline_summary = service.summarize_schedule(
-        baseline_schedule,
-        annual_costs=inputs.annual_insurance + inputs.annual_ground_rent,
-    )
+    if inputs.annual_overpayment > 0:
+        no_overpay_inputs = replace(inputs, annual_overpayment=0.0)
+        baseline_schedule = cached_schedule(no_overpay_inputs)
+        baseline_summary = service.summarize_schedule(
+            baseline_schedule,
+            annual_costs=inputs.annual_insurance + inputs.annual_ground_rent,
+        )
+    else:
+        # Without overpayments the baseline is the schedule we already have.
+        baseline_summary = summary
     monthly_base = service.monthly_payment(
         inputs.loan_amount, inputs.annual_rate_percent, inputs.term_years
     )
@@ -584,23 +739,23 @@ try:
         )
 
     kpi_row(inputs, summary, baseline_summary, monthly_base, currency_symbol)
-    annual = service.annual_view(schedule)
 
+    # Each tab body is an st.fragment, so widgets inside a tab rerun only that tab.
     tab1, tab2, tab3, tab4 = st.tabs(
         ["Dashboard", "Scenario Lab", "Compare Plans", "Cashflow Tables"]
     )
 
     with tab1:
-        render_dashboard(inputs, schedule, annual)
+        render_dashboard(inputs)
 
     with tab2:
-        render_scenario_lab(inputs, scenario, overpayment_levels, currency_symbol)
+        render_scenario_lab(inputs, scenario, tuple(overpayment_levels), currency_symbol)
 
     with tab3:
         render_plan_comparison(inputs, currency_symbol)
 
     with tab4:
-        render_cashflow(schedule, annual, currency_symbol)
+        render_cashflow(inputs, currency_symbol)
 
 except ValueError as exc:
     st.error(f"Input validation error: {exc}")
@@ -1,11 +1,18 @@
 """Mortgage analysis package."""
 
-from .models import MortgageInputs, ScenarioRange
-from .service import MortgageAnalysisService, default_inputs
+from .models import MortgageInputs, ScenarioRange, Schedule, ScheduleTotals
+from .service import MortgageAnalysisService, default_inputs, warm_up
+
+try:
+    warm_up()
+except Exception:  # pragma: no cover - warm-up is best effort; real calls surface errors
+    pass
 
 __all__ = [
     "MortgageInputs",
     "ScenarioRange",
+    "Schedule",
+    "ScheduleTotals",
     "MortgageAnalysisService",
     "default_inputs",
 ]
@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 import math
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class MortgageInputs:
@@ -32,6 +34,55 @@ class ScenarioRange:
     step: float
 
 
+@dataclass(frozen=True)
+class ScheduleTotals:
+    months: int
+    interest: float
+    principal: float
+    overpayment: float
+
+
+@dataclass(frozen=True, eq=False)
+class Schedule:
+    """Monthly amortization stored as aligned arrays, one element per month."""
+
+    month: np.ndarray
+    year: np.ndarray
+    starting_balance: np.ndarray
+    interest: np.ndarray
+    principal: np.ndarray
+    overpayment: np.ndarray
+    balance: np.ndarray
+    totals: ScheduleTotals
+
+    def __len__(self) -> int:
+        return len(self.month)
+
+    @property
+    def payment(self) -> np.ndarray:
+        return self.interest + self.principal
+
+    def head(self, n: int) -> Schedule:
+        interest = self.interest[:n]
+        principal = self.principal[:n]
+        overpayment = self.overpayment[:n]
+        return Schedule(
+            month=self.month[:n],
+            year=self.year[:n],
+            starting_balance=self.starting_balance[:n],
+            interest=interest,
+            principal=principal,
+            overpayment=overpayment,
+            balance=self.balance[:n],
+            totals=ScheduleTotals(
+                months=len(interest),
+                interest=float(interest.sum()),
+                principal=float(principal.sum()),
+                overpayment=float(overpayment.sum()),
+            ),
+        )
+
+
 def ensure_finite_non_negative(value: float, label: str) -> float:
     if not math.isfinite(value):
         raise ValueError(f"{label} must be finite.")
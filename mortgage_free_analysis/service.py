@@ -1,12 +1,398 @@
 from __future__ import annotations
 
 import math
-from dataclasses import asdict
+from dataclasses import fields, replace
+from functools import lru_cache
 
 import numpy as np
 import pandas as pd
 
-from .models import MortgageInputs, ScenarioRange, validate_inputs, validate_scenario_range
+from .models import (
+    MortgageInputs,
+    ScenarioRange,
+    Schedule,
+    ScheduleTotals,
+    ensure_finite_non_negative,
+    validate_inputs,
+    validate_scenario_range,
+)
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+# Metric planes stacked along the first axis of ``rate_overpay_sweep``.
+SWEEP_METRICS = ("monthly_payment", "months", "years", "total_interest", "total_paid", "all_in")
+
+# Rates are rounded before use so float noise from widgets cannot split cache keys.
+_RATE_DECIMALS = 6
+
+# MortgageInputs is flat, so serializing it needs no recursive asdict copy.
+_INPUT_FIELDS = tuple(field.name for field in fields(MortgageInputs))
+
+# Balances below half a cent are floating-point dust, not another month of payments.
+# The snap is also capped at half a payment so tiny payments are never merged.
+_PAYOFF_TOLERANCE = 0.005
+
+
+@njit(cache=True, fastmath=True, error_model="numpy")
+def _amortize_kernel(
+    balance: float,
+    monthly_rate: float,
+    monthly_payment: float,
+    annual_overpayment: float,
+    max_months: int,
+    out_start: np.ndarray,
+    out_interest: np.ndarray,
+    out_principal: np.ndarray,
+    out_overpay: np.ndarray,
+    out_balance: np.ndarray,
+) -> tuple[int, float, float, float]:
+    """Run the month-by-month recurrence into preallocated arrays.
+
+    Returns ``(months, total_interest, total_principal, total_overpayment)``;
+    overpayments land every 12th month.
+    """
+
+    tolerance = min(_PAYOFF_TOLERANCE, 0.5 * monthly_payment)
+    n_months = 0
+    total_interest = 0.0
+    total_principal = 0.0
+    total_overpay = 0.0
+    for m in range(max_months):
+        if balance <= 1e-8:
+            break
+
+        out_start[m] = balance
+        interest = balance * monthly_rate
+        if monthly_rate == 0.0:
+            principal = min(balance, monthly_payment)
+        else:
+            principal = min(balance, max(0.0, monthly_payment - interest))
+        if balance - principal <= tolerance:
+            principal = balance
+
+        balance_after_payment = max(0.0, balance - principal)
+
+        overpay = 0.0
+        if annual_overpayment > 0.0 and (m + 1) % 12 == 0 and balance_after_payment > 0.0:
+            overpay = min(annual_overpayment, balance_after_payment)
+            balance_after_payment -= overpay
+
+        out_interest[m] = interest
+        out_principal[m] = principal
+        out_overpay[m] = overpay
+        out_balance[m] = balance_after_payment
+        total_interest += interest
+        total_principal += principal
+        total_overpay += overpay
+
+        balance = balance_after_payment
+        n_months = m + 1
+
+        if n_months > max_months - 600 and abs(principal) < 1e-9:
+            break
+
+    return n_months, total_interest, total_principal, total_overpay
+
+
+def _amortize_segments(
+    balance: float,
+    monthly_rate: float,
+    monthly_payment: float,
+    annual_overpayment: float,
+    max_months: int,
+    out_start: np.ndarray,
+    out_interest: np.ndarray,
+    out_principal: np.ndarray,
+    out_overpay: np.ndarray,
+    out_balance: np.ndarray,
+) -> tuple[int, float, float, float]:
+    """NumPy equivalent of ``_amortize_kernel`` for when numba is unavailable.
+
+    Between overpayments the balance follows the annuity formula, so each
+    12-month block is solved in closed form and the Python loop runs once per
+    year instead of once per month.
+    """
+
+    # Every block reuses the same (1 + r)**k for k = 1..12.
+    if monthly_rate == 0.0:
+        growth = np.ones(12)
+        annuity = np.arange(1, 13, dtype=np.float64)
+    else:
+        growth = np.cumprod(np.full(12, 1 + monthly_rate))
+        annuity = (growth - 1) / monthly_rate
+
+    tolerance = min(_PAYOFF_TOLERANCE, 0.5 * monthly_payment)
+    n_months = 0
+    total_interest = 0.0
+    total_principal = 0.0
+    total_overpay = 0.0
+    while balance > 1e-8 and n_months < max_months:
+        ending = balance * growth - monthly_payment * annuity
+        cleared = np.flatnonzero(ending <= tolerance)
+        length = int(cleared[0]) + 1 if len(cleared) else 12
+        length = min(length, max_months - n_months)
+
+        ending = ending[:length]
+        if len(cleared) and length == cleared[0] + 1:
+            ending[-1] = 0.0
+        starting = np.concatenate(([balance], ending[:-1]))
+        interest = starting * monthly_rate
+        principal = starting - ending
+
+        overpay = np.zeros(length)
+        if annual_overpayment > 0.0 and length == 12 and ending[-1] > 0.0:
+            overpay[-1] = min(annual_overpayment, ending[-1])
+            ending[-1] -= overpay[-1]
+
+        block = slice(n_months, n_months + length)
+        out_start[block] = starting
+        out_interest[block] = interest
+        out_principal[block] = principal
+        out_overpay[block] = overpay
+        out_balance[block] = ending
+        total_interest += float(interest.sum())
+        total_principal += float(principal.sum())
+        total_overpay += float(overpay[-1])
+
+        balance = float(ending[-1])
+        n_months += length
+
+    return n_months, total_interest, total_principal, total_overpay
+
+
+_amortize = _amortize_kernel if NUMBA_AVAILABLE else _amortize_segments
+
+
+def warm_up() -> None:
+    """Compile (or load from numba's on-disk cache) the JIT kernels ahead of first use.
+
+    Called once at package import so the first user after a server restart
+    does not wait on compilation.
+    """
+
+    buffers = [np.empty(12) for _ in range(5)]
+    _amortize_kernel(1000.0, 0.004, 100.0, 0.0, 12, *buffers)
+
+
+# Schedule frame columns and the matching ``Schedule`` attributes.
+_FRAME_COLUMNS = {
+    "Month": "month",
+    "Year": "year",
+    "Payment": "payment",
+    "Interest": "interest",
+    "Principal": "principal",
+    "Overpayment": "overpayment",
+    "Ending Balance": "balance",
+}
+
+
+def _schedule_columns(schedule: Schedule | pd.DataFrame, *names: str) -> list[np.ndarray]:
+    """Per-month arrays for the named frame columns.
+
+    Accepts the array form or a frame from ``amortization_schedule``; only the
+    requested columns are read from a frame.
+    """
+
+    if isinstance(schedule, Schedule):
+        return [getattr(schedule, _FRAME_COLUMNS[name]) for name in names]
+    return [schedule[name].to_numpy() for name in names]
+
+
+def _year_blocks(year: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """First and last row of each run of equal years in an ascending year array."""
+
+    starts = np.flatnonzero(np.concatenate(([True], year[1:] != year[:-1])))
+    ends = np.append(starts[1:], len(year)) - 1
+    return starts, ends
+
+
+def _yearly_totals(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    return np.add.reduceat(values.astype(np.float64, copy=False), starts)
+
+
+def _rate_grid(low: float, high: float, step: float) -> np.ndarray:
+    """Rates from ``low`` in ``step`` increments, never exceeding ``high``.
+
+    Expects a range from ``validate_scenario_range``, so ``low <= high``. The
+    count is fixed up front and each rate is ``low + i * step``, so float drift
+    cannot add or drop the endpoint.
+    """
+
+    n = int(math.floor((high - low) / step + 1e-9)) + 1
+    return np.round(low + step * np.arange(n), 4)
+
+
+def _monthly_payment_impl(principal: float, annual_rate_percent: float, term_years: int) -> float:
+    r = annual_rate_percent / 100 / 12
+    n = term_years * 12
+    if principal <= 0 or n <= 0:
+        return 0.0
+    if r == 0:
+        return principal / n
+    return principal * (r * (1 + r) ** n) / ((1 + r) ** n - 1)
+
+
+_monthly_payment_cached = lru_cache(maxsize=1024)(_monthly_payment_impl)
+
+
+def _annuity_payment(principal: float, monthly_rates: np.ndarray, n_months: int) -> np.ndarray:
+    """Level monthly payment for each rate in ``monthly_rates``."""
+
+    rates = np.asarray(monthly_rates, dtype=np.float64)
+    if principal <= 0 or n_months <= 0:
+        return np.zeros_like(rates)
+    growth = (1 + rates) ** n_months
+    with np.errstate(divide="ignore", invalid="ignore"):
+        payment = principal * (rates * growth) / (growth - 1)
+    return np.where(rates == 0, principal / n_months, payment)
+
+
+def _build_schedule(
+    loan_amount: float, annual_rate_percent: float, term_years: int, annual_overpayment: float
+) -> Schedule:
+    monthly_rate = annual_rate_percent / 100 / 12
+    standard_monthly = _monthly_payment_cached(loan_amount, annual_rate_percent, term_years)
+
+    max_months = term_years * 12 + 1200
+    starting_balance = np.empty(max_months)
+    interest = np.empty(max_months)
+    principal = np.empty(max_months)
+    overpayment = np.empty(max_months)
+    ending_balance = np.empty(max_months)
+
+    n_months, total_interest, total_principal, total_overpay = _amortize(
+        loan_amount,
+        monthly_rate,
+        standard_monthly,
+        annual_overpayment,
+        max_months,
+        starting_balance,
+        interest,
+        principal,
+        overpayment,
+        ending_balance,
+    )
+
+    months = np.arange(1, n_months + 1, dtype=np.int64)
+    schedule = Schedule(
+        month=months,
+        year=(months - 1) // 12 + 1,
+        starting_balance=starting_balance[:n_months].copy(),
+        # Copy the trimmed months out so the cache does not keep the full
+        # scratch buffers (sized for the 1200-month guard) alive.
+        interest=interest[:n_months].copy(),
+        principal=principal[:n_months].copy(),
+        overpayment=overpayment[:n_months].copy(),
+        balance=ending_balance[:n_months].copy(),
+        totals=ScheduleTotals(
+            months=n_months,
+            interest=total_interest,
+            principal=total_principal,
+            overpayment=total_overpay,
+        ),
+    )
+    # Cached schedules are shared between callers, so they must not be mutated.
+    for values in (
+        schedule.month,
+        schedule.year,
+        schedule.starting_balance,
+        schedule.interest,
+        schedule.principal,
+        schedule.overpayment,
+        schedule.balance,
+    ):
+        values.flags.writeable = False
+    return schedule
+
+
+# Only the loan, rate, term and overpayment shape the schedule, so scenarios that
+# differ in costs or property value share an entry.
+_schedule_cached = lru_cache(maxsize=256)(_build_schedule)
+
+
+def _payoff_totals(
+    loan: float,
+    annual_rates: np.ndarray,
+    term_years: int,
+    annual_overpayments: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Closed-form payoff for every broadcast (rate, overpayment) pair.
+
+    Returns ``(monthly_payment, months, total_paid)`` arrays. Each pass of the
+    loop advances every unfinished cell by one year of annuity payments plus
+    the annual overpayment; the final partial year is solved analytically.
+    """
+
+    r, overpay = np.broadcast_arrays(
+        np.round(np.asarray(annual_rates, dtype=np.float64), _RATE_DECIMALS) / 100 / 12,
+        np.asarray(annual_overpayments, dtype=np.float64),
+    )
+    payment = _annuity_payment(loan, r, term_years * 12)
+    months = np.zeros(r.shape, dtype=np.int64)
+    total_paid = np.zeros(r.shape, dtype=np.float64)
+    balance = np.full(r.shape, float(loan))
+    active = payment > 0
+
+    zero_rate = r == 0
+    safe_r = np.where(zero_rate, 1.0, r)
+    safe_payment = np.where(active, payment, 1.0)
+    growth_12 = (1 + r) ** 12
+    annuity_12 = np.where(zero_rate, 12.0, (growth_12 - 1) / safe_r)
+    tolerance = np.minimum(_PAYOFF_TOLERANCE, 0.5 * safe_payment)
+    final_threshold = (safe_payment + tolerance) / (1 + r)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        while active.any():
+            # Full payments made before the month that clears the balance.
+            full_months = np.where(
+                zero_rate,
+                (balance - final_threshold) / safe_payment,
+                np.log(
+                    (safe_payment / safe_r - final_threshold)
+                    / (safe_payment / safe_r - balance)
+                )
+                / np.log1p(r),
+            )
+            full_months = np.where(balance <= final_threshold, 0.0, full_months)
+            full_months = np.maximum(0, np.ceil(full_months - 1e-9))
+
+            finishing = active & (full_months < 12)
+            growth = (1 + r) ** full_months
+            last_balance = np.where(
+                zero_rate,
+                balance - full_months * safe_payment,
+                balance * growth - safe_payment * (growth - 1) / safe_r,
+            )
+            total_paid += np.where(
+                finishing, full_months * safe_payment + last_balance * (1 + r), 0.0
+            )
+            months += np.where(finishing, full_months.astype(np.int64) + 1, 0)
+            active &= ~finishing
+
+            stepped = np.where(
+                zero_rate,
+                balance - 12 * safe_payment,
+                balance * growth_12 - safe_payment * annuity_12,
+            )
+            extra = np.where(active & (overpay > 0), np.minimum(overpay, stepped), 0.0)
+            balance = np.where(active, stepped - extra, balance)
+            total_paid += np.where(active, 12 * safe_payment + extra, 0.0)
+            months += np.where(active, 12, 0)
+            active &= balance > 1e-8
+
+    return payment, months, total_paid
 
 
 class MortgageAnalysisService:
@@ -15,75 +401,73 @@ class MortgageAnalysisService:
     def monthly_payment(
         self, principal: float, annual_rate_percent: float, term_years: int
     ) -> float:
-        r = annual_rate_percent / 100 / 12
-        n = term_years * 12
-        if principal <= 0 or n <= 0:
-            return 0.0
-        if r == 0:
-            return principal / n
-        return principal * (r * (1 + r) ** n) / ((1 + r) ** n - 1)
+        return _monthly_payment_cached(
+            float(principal), round(float(annual_rate_percent), _RATE_DECIMALS), int(term_years)
+        )
 
-    def amortization_schedule(self, inputs: MortgageInputs) -> pd.DataFrame:
-        checked = validate_inputs(inputs)
-        balance = checked.loan_amount
-        monthly_rate = checked.annual_rate_percent / 100 / 12
-        standard_monthly = self.monthly_payment(
-            checked.loan_amount, checked.annual_rate_percent, checked.term_years
-        )
-
-        rows: list[dict[str, float | int]] = []
-        month = 0
-        total_interest = 0.0
-        total_principal = 0.0
-        total_overpay = 0.0
-        max_months = checked.term_years * 12
-
-        while balance > 1e-8 and month < max_months + 1200:
-            month += 1
-            interest = balance * monthly_rate
-
-            if monthly_rate == 0:
-                principal_component = min(balance, standard_monthly)
-            else:
-                principal_component = min(balance, max(0.0, standard_monthly - interest))
-
-            payment = principal_component + interest
-            balance_after_payment = max(0.0, balance - principal_component)
-
-            overpayment = 0.0
-            if checked.annual_overpayment > 0 and month % 12 == 0 and balance_after_payment > 0:
-                overpayment = min(checked.annual_overpayment, balance_after_payment)
-                balance_after_payment -= overpayment
-
-            total_interest += interest
-            total_principal += principal_component
-            total_overpay += overpayment
-
-            rows.append(
-                {
-                    "Month": month,
-                    "Year": math.ceil(month / 12),
-                    "Starting Balance": balance,
-                    "Payment": payment,
-                    "Interest": interest,
-                    "Principal": principal_component,
-                    "Overpayment": overpayment,
-                    "Ending Balance": balance_after_payment,
-                    "Cumulative Interest": total_interest,
-                    "Cumulative Principal": total_principal,
-                    "Cumulative Overpayment": total_overpay,
-                }
-            )
+    def monthly_payments(
+        self, principal: float, annual_rates_percent: np.ndarray, term_years: int
+    ) -> np.ndarray:
+        """Vectorized ``monthly_payment`` over an array of annual rates."""
 
-            balance = balance_after_payment
+        rates = np.round(np.asarray(annual_rates_percent, dtype=np.float64), _RATE_DECIMALS)
+        return _annuity_payment(float(principal), rates / 100 / 12, int(term_years) * 12)
 
-            if month > max_months + 600 and abs(rows[-1]["Principal"]) < 1e-9:
-                break
+    def schedule_arrays(self, inputs: MortgageInputs) -> Schedule:
+        return self._schedule_from_checked(validate_inputs(inputs))
 
-        return pd.DataFrame(rows)
+    def _schedule_from_checked(self, checked: MortgageInputs) -> Schedule:
+        return _schedule_cached(
+            checked.loan_amount,
+            round(checked.annual_rate_percent, _RATE_DECIMALS),
+            checked.term_years,
+            checked.annual_overpayment,
+        )
 
-    def summarize_schedule(self, schedule: pd.DataFrame, annual_costs: float) -> dict[str, float]:
-        if schedule.empty:
+    def schedule_frame(self, schedule: Schedule) -> pd.DataFrame:
+        if len(schedule) == 0:
+            return pd.DataFrame()
+
+        return pd.DataFrame(
+            {
+                "Month": schedule.month,
+                "Year": schedule.year,
+                "Starting Balance": schedule.starting_balance,
+                "Payment": schedule.payment,
+                "Interest": schedule.interest,
+                "Principal": schedule.principal,
+                "Overpayment": schedule.overpayment,
+                "Ending Balance": schedule.balance,
+                "Cumulative Interest": np.cumsum(schedule.interest, dtype=np.float64),
+                "Cumulative Principal": np.cumsum(schedule.principal, dtype=np.float64),
+                "Cumulative Overpayment": np.cumsum(schedule.overpayment, dtype=np.float64),
+            }
+        )
+
+    def amortization_schedule(self, inputs: MortgageInputs) -> pd.DataFrame:
+        return self.schedule_frame(self.schedule_arrays(inputs))
+
+    def summarize_schedule(
+        self, schedule: Schedule | pd.DataFrame, annual_costs: float
+    ) -> dict[str, float]:
+        if isinstance(schedule, Schedule):
+            totals = schedule.totals
+            months = float(totals.months)
+            total_interest = totals.interest
+            total_payment = totals.interest + totals.principal
+            total_overpayment = totals.overpayment
+        elif not schedule.empty:
+            month, interest, payment, overpayment = _schedule_columns(
+                schedule, "Month", "Interest", "Payment", "Overpayment"
+            )
+            months = float(month.max())
+            total_interest = float(interest.sum(dtype=np.float64))
+            total_payment = float(payment.sum(dtype=np.float64))
+            total_overpayment = float(overpayment.sum(dtype=np.float64))
+        else:
+            months = 0.0
+
+        if months == 0:
             return {
                 "months": 0.0,
                 "years": 0.0,
@@ -93,10 +477,6 @@ class MortgageAnalysisService:
                 "all_in_housing_cost": 0.0,
             }
 
-        months = float(schedule["Month"].max())
-        total_interest = float(schedule["Interest"].sum())
-        total_payment = float(schedule["Payment"].sum())
-        total_overpayment = float(schedule["Overpayment"].sum())
         years = months / 12
         recurring_costs = annual_costs * years
 
@@ -109,49 +489,97 @@ class MortgageAnalysisService:
             "all_in_housing_cost": total_payment + total_overpayment + recurring_costs,
         }
 
-    def annual_view(self, schedule: pd.DataFrame) -> pd.DataFrame:
-        grouped = (
-            schedule.groupby("Year", as_index=False)[
-                ["Payment", "Interest", "Principal", "Overpayment"]
-            ]
-            .sum()
-            .rename(
-                columns={
-                    "Payment": "Annual Payment",
-                    "Interest": "Annual Interest",
-                    "Principal": "Annual Principal",
-                    "Overpayment": "Annual Overpayment",
-                }
-            )
+    def annual_view(self, schedule: Schedule | pd.DataFrame) -> pd.DataFrame:
+        columns = [
+            "Year",
+            "Annual Payment",
+            "Annual Interest",
+            "Annual Principal",
+            "Annual Overpayment",
+            "Ending Balance",
+        ]
+        if len(schedule) == 0:
+            return pd.DataFrame(columns=columns)
+
+        year, payment, interest, principal, overpayment, balance = _schedule_columns(
+            schedule, "Year", "Payment", "Interest", "Principal", "Overpayment", "Ending Balance"
         )
-        ending_balance = schedule.groupby("Year", as_index=False)["Ending Balance"].last()
-        return grouped.merge(ending_balance, on="Year", how="left")
+
+        # Rows are ordered by month, so each year is one contiguous block and a
+        # single reduceat pass sums it. Labels come from the rows themselves, so
+        # a frame filtered to later years keeps its real year numbers. Every
+        # column below is a fresh array, so the frame can take ownership.
+        starts, ends = _year_blocks(year)
+        return pd.DataFrame(
+            {
+                "Year": year[ends],
+                "Annual Payment": _yearly_totals(payment, starts),
+                "Annual Interest": _yearly_totals(interest, starts),
+                "Annual Principal": _yearly_totals(principal, starts),
+                "Annual Overpayment": _yearly_totals(overpayment, starts),
+                "Ending Balance": balance[ends],
+            },
+            columns=columns,
+            copy=False,
+        )
+
+    def fast_scenario_metrics(
+        self,
+        loan: float,
+        annual_rate: float,
+        term_years: int,
+        annual_overpay: float,
+        annual_costs: float = 0.0,
+    ) -> dict[str, float]:
+        """Payoff metrics without simulating individual months.
+
+        Steps one year at a time using the annuity balance formula, then solves
+        the final partial year in closed form. Agrees with ``summarize_schedule``
+        applied to ``amortization_schedule`` for the same inputs.
+        """
+
+        _, months, total_paid = _payoff_totals(
+            loan, np.float64(annual_rate), term_years, np.float64(annual_overpay)
+        )
+        paid = float(total_paid)
+        years = float(months) / 12
+        return {
+            "months": float(months),
+            "years": years,
+            "total_interest": paid - loan if months else 0.0,
+            "total_paid": paid,
+            "all_in": paid + annual_costs * years,
+        }
 
     def scenario_result(
         self,
         base_inputs: MortgageInputs,
         rate: float,
         annual_overpayment: float,
-    ) -> dict[str, float | pd.DataFrame]:
+        want_schedule: bool = True,
+    ) -> dict[str, float | pd.DataFrame | None]:
+        """Summary metrics for one rate and overpayment.
+
+        The monthly frame is returned under ``"schedule"``; pass
+        ``want_schedule=False`` to get ``None`` there and skip building it.
+        """
+
         scenario_inputs = validate_inputs(
-            MortgageInputs(
-                property_value=base_inputs.property_value,
-                loan_amount=base_inputs.loan_amount,
-                annual_rate_percent=rate,
-                term_years=base_inputs.term_years,
-                annual_insurance=base_inputs.annual_insurance,
-                annual_ground_rent=base_inputs.annual_ground_rent,
-                annual_overpayment=annual_overpayment,
-            )
+            replace(base_inputs, annual_rate_percent=rate, annual_overpayment=annual_overpayment)
         )
-        schedule = self.amortization_schedule(scenario_inputs)
+        return self._scenario_result_from_checked(scenario_inputs, want_schedule)
+
+    def _scenario_result_from_checked(
+        self, scenario_inputs: MortgageInputs, want_schedule: bool = True
+    ) -> dict[str, float | pd.DataFrame | None]:
+        schedule = self._schedule_from_checked(scenario_inputs)
         summary = self.summarize_schedule(
             schedule,
             annual_costs=scenario_inputs.annual_insurance + scenario_inputs.annual_ground_rent,
         )
         return {
-            "rate": float(rate),
-            "annual_overpayment": float(annual_overpayment),
+            "rate": scenario_inputs.annual_rate_percent,
+            "annual_overpayment": scenario_inputs.annual_overpayment,
             "monthly_payment": self.monthly_payment(
                 scenario_inputs.loan_amount,
                 scenario_inputs.annual_rate_percent,
@@ -162,36 +590,111 @@ class MortgageAnalysisService:
             "interest": summary["total_interest"],
             "paid_to_bank": summary["total_paid_to_bank"],
             "all_in": summary["all_in_housing_cost"],
-            "schedule": schedule,
+            "schedule": self.schedule_frame(schedule) if want_schedule else None,
         }
 
+    def rate_overpay_sweep(
+        self,
+        inputs: MortgageInputs,
+        scenario_range: ScenarioRange,
+        annual_overpayment_options: list[float],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Every scenario metric over the overpayment x rate grid in one pass.
+
+        Returns ``(overpayments, rates, metrics)`` where ``metrics`` has shape
+        ``[len(SWEEP_METRICS), len(overpayments), len(rates)]``. Overpayment
+        levels are sorted and de-duplicated.
+        """
+
+        return self._sweep_from_checked(
+            validate_inputs(inputs), scenario_range, annual_overpayment_options
+        )
+
+    def _sweep_from_checked(
+        self,
+        checked: MortgageInputs,
+        scenario_range: ScenarioRange,
+        annual_overpayment_options: list[float],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        rates = validate_scenario_range(scenario_range)
+        rate_values = _rate_grid(rates.low_rate, rates.high_rate, rates.step)
+        overpay_values = np.unique(
+            np.array(
+                [
+                    ensure_finite_non_negative(float(overpay), "Annual overpayment")
+                    for overpay in annual_overpayment_options
+                ],
+                dtype=np.float64,
+            )
+        )
+
+        payment, months, total_paid = _payoff_totals(
+            checked.loan_amount, rate_values[None, :], checked.term_years, overpay_values[:, None]
+        )
+        years = months / 12
+        annual_costs = checked.annual_insurance + checked.annual_ground_rent
+        metrics = np.stack(
+            [
+                np.broadcast_to(payment, months.shape),
+                months.astype(np.float64),
+                years,
+                np.where(months > 0, total_paid - checked.loan_amount, 0.0),
+                total_paid,
+                total_paid + annual_costs * years,
+            ]
+        )
+        return overpay_values, rate_values, metrics
+
+    def scenario_slice(
+        self,
+        sweep: tuple[np.ndarray, np.ndarray, np.ndarray],
+        annual_overpayment: float,
+    ) -> pd.DataFrame:
+        """Scenario table for one overpayment level of a ``rate_overpay_sweep``."""
+
+        overpay_values, rate_values, metrics = sweep
+        matches = np.flatnonzero(overpay_values == annual_overpayment)
+        if len(matches) == 0:
+            raise ValueError("Annual overpayment is not part of the scenario sweep.")
+        plane = metrics[:, matches[0], :]
+        return pd.DataFrame(
+            {
+                "Rate %": rate_values,
+                "Monthly Payment (before overpay)": plane[SWEEP_METRICS.index("monthly_payment")],
+                "Mortgage-Free in Years": plane[SWEEP_METRICS.index("years")],
+                "Mortgage-Free in Months": plane[SWEEP_METRICS.index("months")],
+                "Total Interest": plane[SWEEP_METRICS.index("total_interest")],
+                "Total Paid to Lender": plane[SWEEP_METRICS.index("total_paid")],
+                "All-in Cost": plane[SWEEP_METRICS.index("all_in")],
+            }
+        )
+
     def scenario_analysis(
         self,
         inputs: MortgageInputs,
         scenario_range: ScenarioRange,
     ) -> pd.DataFrame:
         checked = validate_inputs(inputs)
-        rates = validate_scenario_range(scenario_range)
+        sweep = self._sweep_from_checked(checked, scenario_range, [checked.annual_overpayment])
+        return self.scenario_slice(sweep, checked.annual_overpayment)
 
-        values = np.round(np.arange(rates.low_rate, rates.high_rate + rates.step / 2, rates.step), 4)
-        values = np.sort(values)
-
-        rows: list[dict[str, float]] = []
-        for rate in values:
-            result = self.scenario_result(checked, float(rate), checked.annual_overpayment)
-            rows.append(
-                {
-                    "Rate %": float(rate),
-                    "Monthly Payment (before overpay)": result["monthly_payment"],
-                    "Mortgage-Free in Years": result["years"],
-                    "Mortgage-Free in Months": result["months"],
-                    "Total Interest": result["interest"],
-                    "Total Paid to Lender": result["paid_to_bank"],
-                    "All-in Cost": result["all_in"],
-                }
-            )
+    def build_heatmap_grid(
+        self,
+        inputs: MortgageInputs,
+        scenario_range: ScenarioRange,
+        annual_overpayment_options: list[float],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Payoff years on an overpayment x rate grid.
 
-        return pd.DataFrame(rows)
+        Returns ``(overpayments, rates, years)`` where ``years[i, j]`` is the
+        payoff time for ``overpayments[i]`` at ``rates[j]``. Overpayment levels
+        are sorted and de-duplicated.
+        """
+
+        overpay_values, rate_values, metrics = self.rate_overpay_sweep(
+            inputs, scenario_range, annual_overpayment_options
+        )
+        return overpay_values, rate_values, metrics[SWEEP_METRICS.index("years")]
 
     def build_heatmap_data(
         self,
@@ -199,30 +702,27 @@ class MortgageAnalysisService:
         scenario_range: ScenarioRange,
         annual_overpayment_options: list[float],
     ) -> pd.DataFrame:
-        checked = validate_inputs(inputs)
-        rates = validate_scenario_range(scenario_range)
+        """Long-form view of the heatmap grid, with total interest per cell."""
 
-        rate_values = np.round(
-            np.arange(rates.low_rate, rates.high_rate + rates.step / 2, rates.step), 4
-        )
-        rows: list[dict[str, float]] = []
-
-        for rate in rate_values:
-            for overpay in annual_overpayment_options:
-                result = self.scenario_result(checked, float(rate), float(overpay))
-                rows.append(
-                    {
-                        "Rate %": float(rate),
-                        "Annual Overpayment": float(overpay),
-                        "Mortgage-Free in Years": float(result["years"]),
-                        "Total Interest": float(result["interest"]),
-                    }
-                )
-        return pd.DataFrame(rows)
+        overpay_values, rate_values, metrics = self.rate_overpay_sweep(
+            inputs, scenario_range, annual_overpayment_options
+        )
+
+        # Long form ordered by rate, then overpayment; repeat/tile/ravel of the
+        # transpose all allocate, so no extra copy is needed.
+        return pd.DataFrame(
+            {
+                "Rate %": np.repeat(rate_values, len(overpay_values)),
+                "Annual Overpayment": np.tile(overpay_values, len(rate_values)),
+                "Mortgage-Free in Years": metrics[SWEEP_METRICS.index("years")].T.ravel(),
+                "Total Interest": metrics[SWEEP_METRICS.index("total_interest")].T.ravel(),
+            },
+            copy=False,
+        )
 
     def serialize_inputs(self, inputs: MortgageInputs) -> dict[str, float | int]:
         checked = validate_inputs(inputs)
-        data = asdict(checked)
+        data = {name: getattr(checked, name) for name in _INPUT_FIELDS}
         data["deposit"] = checked.deposit
         data["ltv_percent"] = checked.ltv_percent
         return data
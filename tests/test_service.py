@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from dataclasses import replace
+
+import numpy as np
 import pandas as pd
 import pytest
 
 from mortgage_free_analysis.models import MortgageInputs, ScenarioRange, validate_inputs, validate_scenario_range
-from mortgage_free_analysis.service import MortgageAnalysisService, default_inputs
+from mortgage_free_analysis import service as service_module
+from mortgage_free_analysis.service import SWEEP_METRICS, MortgageAnalysisService, default_inputs
 
 
 @pytest.fixture
@@ -64,12 +68,30 @@ def test_annual_view_has_expected_columns(service: MortgageAnalysisService) -> N
     }
 
 
+def test_annual_view_keeps_year_labels_of_filtered_frame(service: MortgageAnalysisService) -> None:
+    frame = service.amortization_schedule(default_inputs())
+    full = service.annual_view(frame)
+    later = service.annual_view(frame[frame["Year"] > 10])
+
+    assert later["Year"].iloc[0] == 11
+    pd.testing.assert_frame_equal(later, full[full["Year"] > 10].reset_index(drop=True))
+
+
 def test_scenario_analysis_row_count(service: MortgageAnalysisService) -> None:
     df = service.scenario_analysis(default_inputs(), ScenarioRange(low_rate=3, high_rate=4, step=0.5))
     assert len(df) == 3
     assert "Total Interest" in df.columns
 
 
+def test_rate_grid_hits_endpoints_without_drift() -> None:
+    grid = service_module._rate_grid(1.0, 2.0, 0.1)
+
+    assert len(grid) == 11
+    assert grid[0] == 1.0
+    assert grid[-1] == 2.0
+    assert np.all(np.diff(grid) > 0)
+
+
 def test_heatmap_data_shape(service: MortgageAnalysisService) -> None:
     df = service.build_heatmap_data(
         default_inputs(),
@@ -84,3 +106,192 @@ def test_summary_empty_schedule(service: MortgageAnalysisService) -> None:
     summary = service.summarize_schedule(pd.DataFrame(), annual_costs=100)
     assert summary["months"] == 0
     assert summary["all_in_housing_cost"] == 0
+
+
+def test_summary_reads_only_the_columns_it_needs(service: MortgageAnalysisService) -> None:
+    frame = service.amortization_schedule(default_inputs())
+    minimal = frame[["Month", "Interest", "Payment", "Overpayment"]]
+
+    assert service.summarize_schedule(minimal, annual_costs=1200) == pytest.approx(
+        service.summarize_schedule(frame, annual_costs=1200)
+    )
+
+
+@pytest.mark.parametrize("rate", [0.0, 5.0])
+def test_tiny_payments_are_not_merged_into_payoff(service: MortgageAnalysisService, rate: float) -> None:
+    inputs = MortgageInputs(10.0, 1.0, rate, 50, 0.0, 0.0, 0.0)
+
+    assert len(service.schedule_arrays(inputs)) == 600
+    assert service.fast_scenario_metrics(1.0, rate, 50, 0.0)["months"] == 600
+
+
+def test_amortization_schedule_overpays_every_twelfth_month(service: MortgageAnalysisService) -> None:
+    schedule = service.amortization_schedule(default_inputs())
+    overpay_months = schedule.loc[schedule["Overpayment"] > 0, "Month"]
+    assert not overpay_months.empty
+    assert (overpay_months % 12 == 0).all()
+    assert schedule["Ending Balance"].is_monotonic_decreasing
+
+
+def test_standard_term_has_no_trailing_dust_month(service: MortgageAnalysisService) -> None:
+    inputs = MortgageInputs(
+        property_value=1_200_000,
+        loan_amount=1_000_000,
+        annual_rate_percent=12.5,
+        term_years=30,
+        annual_insurance=0,
+        annual_ground_rent=0,
+        annual_overpayment=0,
+    )
+    schedule = service.amortization_schedule(inputs)
+    assert len(schedule) == 360
+
+
+@pytest.mark.parametrize(
+    ("rate", "term_years", "overpay"),
+    [(0.0, 10, 0.0), (0.0, 25, 5000.0), (3.5, 30, 0.0), (5.0, 30, 6000.0), (12.0, 15, 250000.0)],
+)
+def test_fast_scenario_metrics_matches_schedule(
+    service: MortgageAnalysisService, rate: float, term_years: int, overpay: float
+) -> None:
+    inputs = MortgageInputs(
+        property_value=300000,
+        loan_amount=240000,
+        annual_rate_percent=rate,
+        term_years=term_years,
+        annual_insurance=1200,
+        annual_ground_rent=100,
+        annual_overpayment=overpay,
+    )
+    summary = service.summarize_schedule(service.schedule_arrays(inputs), annual_costs=1300)
+    metrics = service.fast_scenario_metrics(240000, rate, term_years, overpay, annual_costs=1300)
+
+    assert metrics["months"] == summary["months"]
+    assert metrics["total_interest"] == pytest.approx(summary["total_interest"], abs=1e-4)
+    assert metrics["total_paid"] == pytest.approx(summary["total_paid_to_bank"], abs=1e-4)
+    assert metrics["all_in"] == pytest.approx(summary["all_in_housing_cost"], abs=1e-4)
+
+
+def test_heatmap_cells_match_single_scenario(service: MortgageAnalysisService) -> None:
+    inputs = default_inputs()
+    df = service.build_heatmap_data(inputs, ScenarioRange(low_rate=3, high_rate=5, step=1), [0, 6000])
+    cell = df[(df["Rate %"] == 4) & (df["Annual Overpayment"] == 6000)].iloc[0]
+    metrics = service.fast_scenario_metrics(inputs.loan_amount, 4.0, inputs.term_years, 6000.0)
+    assert cell["Mortgage-Free in Years"] == pytest.approx(metrics["years"])
+    assert cell["Total Interest"] == pytest.approx(metrics["total_interest"])
+
+
+def test_scenario_result_can_skip_schedule(service: MortgageAnalysisService) -> None:
+    full = service.scenario_result(default_inputs(), rate=4.0, annual_overpayment=6000.0)
+    lean = service.scenario_result(
+        default_inputs(), rate=4.0, annual_overpayment=6000.0, want_schedule=False
+    )
+
+    assert lean["schedule"] is None
+    assert len(full["schedule"]) == full["months"]
+    assert {k: v for k, v in full.items() if k != "schedule"} == {
+        k: v for k, v in lean.items() if k != "schedule"
+    }
+
+
+def test_heatmap_grid_is_sorted_and_matches_long_form(service: MortgageAnalysisService) -> None:
+    scenario = ScenarioRange(low_rate=3, high_rate=4, step=0.5)
+    overpayments, rates, years = service.build_heatmap_grid(default_inputs(), scenario, [6000, 0, 6000])
+    assert overpayments.tolist() == [0, 6000]
+    assert rates.tolist() == [3.0, 3.5, 4.0]
+    assert years.shape == (2, 3)
+
+    df = service.build_heatmap_data(default_inputs(), scenario, [0, 6000])
+    pivot = df.pivot(index="Annual Overpayment", columns="Rate %", values="Mortgage-Free in Years")
+    assert pivot.to_numpy() == pytest.approx(years)
+
+
+def test_schedule_arrays_match_frame(service: MortgageAnalysisService) -> None:
+    schedule = service.schedule_arrays(default_inputs())
+    frame = service.amortization_schedule(default_inputs())
+
+    assert len(schedule) == len(frame)
+    assert schedule.balance == pytest.approx(frame["Ending Balance"].to_numpy())
+    assert service.summarize_schedule(schedule, annual_costs=1200) == pytest.approx(
+        service.summarize_schedule(frame, annual_costs=1200)
+    )
+    pd.testing.assert_frame_equal(service.annual_view(schedule), service.annual_view(frame))
+
+
+def test_starting_balance_keeps_cents_on_large_loans(service: MortgageAnalysisService) -> None:
+    inputs = replace(default_inputs(), property_value=20_000_000.0, loan_amount=12_345_678.91)
+    frame = service.amortization_schedule(inputs)
+
+    assert frame["Starting Balance"].dtype == np.float64
+    assert frame["Starting Balance"].iloc[0] == 12_345_678.91
+
+
+def test_schedule_arrays_are_shared_across_cost_only_changes(service: MortgageAnalysisService) -> None:
+    base = default_inputs()
+    schedule = service.schedule_arrays(base)
+    again = service.schedule_arrays(replace(base, annual_insurance=0.0, property_value=500000.0))
+
+    assert again is schedule
+    assert not schedule.balance.flags.writeable
+    # Cached arrays own their months rather than viewing the scratch buffers.
+    assert schedule.balance.base is None
+
+
+def test_schedule_frame_keeps_float64_balances(service: MortgageAnalysisService) -> None:
+    inputs = replace(default_inputs(), property_value=60_000_000.0, loan_amount=45_700_000.0)
+    frame = service.amortization_schedule(inputs)
+    annual = service.annual_view(frame)
+
+    assert (frame.dtypes[frame.columns[2:]] == np.float64).all()
+    assert (annual.dtypes[annual.columns[1:]] == np.float64).all()
+    # Each month opens exactly where the previous one closed.
+    assert (frame["Starting Balance"].to_numpy()[1:] == frame["Ending Balance"].to_numpy()[:-1]).all()
+    assert "e+" not in annual.to_csv(index=False)
+
+
+def test_rate_overpay_sweep_slices_match_scenario_and_heatmap(service: MortgageAnalysisService) -> None:
+    inputs = default_inputs()
+    scenario = ScenarioRange(low_rate=3, high_rate=5, step=0.5)
+    sweep = service.rate_overpay_sweep(inputs, scenario, [0, 3000, inputs.annual_overpayment])
+    overpayments, rates, metrics = sweep
+    assert metrics.shape == (len(SWEEP_METRICS), 3, 5)
+
+    pd.testing.assert_frame_equal(
+        service.scenario_slice(sweep, inputs.annual_overpayment),
+        service.scenario_analysis(inputs, scenario),
+    )
+    _, _, years = service.build_heatmap_grid(inputs, scenario, [0, 3000, inputs.annual_overpayment])
+    assert metrics[SWEEP_METRICS.index("years")] == pytest.approx(years)
+
+    with pytest.raises(ValueError, match="not part of the scenario sweep"):
+        service.scenario_slice(sweep, 1234.0)
+
+
+def test_monthly_payment_ignores_float_noise_in_rate(service: MortgageAnalysisService) -> None:
+    payment = service.monthly_payment(principal=240000, annual_rate_percent=4.25, term_years=30)
+    noisy = service.monthly_payment(principal=240000, annual_rate_percent=4.25 + 1e-12, term_years=30)
+    assert noisy == payment
+
+
+def test_monthly_payments_match_scalar_payment(service: MortgageAnalysisService) -> None:
+    rates = np.array([0.0, 1.5, 5.0, 12.25])
+
+    assert service.monthly_payments(240000, rates, 25) == pytest.approx(
+        [service.monthly_payment(240000, rate, 25) for rate in rates]
+    )
+
+
+@pytest.mark.parametrize(("rate", "overpay"), [(0.0, 0.0), (0.0, 5000.0), (5.0, 0.0), (5.0, 6000.0), (9.0, 90000.0)])
+def test_numpy_segments_match_kernel(rate: float, overpay: float) -> None:
+    payment = MortgageAnalysisService().monthly_payment(240000, rate, 30)
+    results = []
+    for amortize in (service_module._amortize_kernel, service_module._amortize_segments):
+        buffers = [np.empty(1560) for _ in range(5)]
+        totals = amortize(240000.0, rate / 100 / 12, payment, overpay, 1560, *buffers)
+        results.append((totals, [buffer[: totals[0]] for buffer in buffers]))
+
+    (kernel_totals, kernel_arrays), (segment_totals, segment_arrays) = results
+    assert segment_totals[0] == kernel_totals[0]
+    assert segment_totals[1:] == pytest.approx(kernel_totals[1:], abs=1e-4)
+    for kernel_array, segment_array in zip(kernel_arrays, segment_arrays):
+        assert segment_array == pytest.approx(kernel_array, abs=1e-2)
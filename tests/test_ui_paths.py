@@ -52,3 +52,94 @@ def test_compare_plan_controls_and_heatmap_render() -> None:
     # Scenario inputs must exist so users can run the full exploration flow.
     assert at.number_input(key="scenario_low").value is not None
     assert at.number_input(key="scenario_high").value is not None
+
+
+def test_zero_overpayment_reports_no_savings() -> None:
+    at = AppTest.from_file("app.py")
+    at.run(timeout=30)
+
+    at.number_input(key="annual_overpayment").set_value(0.0)
+    at.run(timeout=30)
+
+    assert not at.exception
+    payoff = next(m for m in at.metric if m.label == "Mortgage-free in")
+    assert payoff.delta == "0.00 years faster"
+
+
+def test_invalid_overpayment_level_warns_and_is_ignored() -> None:
+    at = AppTest.from_file("app.py")
+    at.run(timeout=30)
+
+    at.text_input(key="overpay_levels").set_value("0, abc, 6000")
+    at.run(timeout=30)
+
+    assert not at.exception
+    warnings = [w.value for w in at.warning]
+    assert any("Ignoring invalid overpayment value: abc" in msg for msg in warnings)
+
+
+def test_plan_comparison_inputs_render_both_plans() -> None:
+    at = AppTest.from_file("app.py")
+    at.run(timeout=30)
+
+    at.number_input(key="rate_b").set_value(2.5)
+    at.number_input(key="overpay_b").set_value(12000.0)
+    at.run(timeout=30)
+
+    assert not at.exception
+    labels = {m.label for m in at.metric}
+    assert {"A: Mortgage-free", "B: Mortgage-free"}.issubset(labels)
+
+
+def test_oversized_scenario_grid_shows_validation_error() -> None:
+    at = AppTest.from_file("app.py")
+    at.run(timeout=30)
+
+    at.number_input(key="scenario_low").set_value(0.0)
+    at.number_input(key="scenario_high").set_value(30.0)
+    at.selectbox(key="scenario_step").set_value(0.05)
+    at.run(timeout=30)
+
+    errors = [e.value for e in at.error]
+    assert any("Scenario grid is too large" in msg for msg in errors)
+
+
+def test_bad_heatmap_levels_warn_and_keep_scenario_lab() -> None:
+    at = AppTest.from_file("app.py")
+    at.run(timeout=30)
+
+    at.text_input(key="overpay_levels").set_value("0, -500, inf, 6000")
+    at.run(timeout=30)
+
+    assert not at.exception
+    assert not at.error
+    warnings = [w.value for w in at.warning]
+    assert any("Ignoring invalid overpayment value: -500" in msg for msg in warnings)
+    assert any("Ignoring invalid overpayment value: inf" in msg for msg in warnings)
+    columns = [set(df.value.columns) for df in at.dataframe]
+    assert any("Mortgage-Free in Months" in cols for cols in columns)
+
+
+def test_zero_loan_renders_without_errors() -> None:
+    at = AppTest.from_file("app.py")
+    at.run(timeout=30)
+
+    at.number_input(key="loan_amount").set_value(0.0)
+    at.run(timeout=30)
+
+    assert not at.exception
+    assert not at.error
+    infos = [i.value for i in at.info]
+    assert any("No mortgage balance" in msg for msg in infos)
+
+
+def test_result_tables_stay_numeric_for_sorting() -> None:
+    at = AppTest.from_file("app.py")
+    at.run(timeout=30)
+
+    assert not at.exception
+    tables = {frozenset(df.value.columns): df.value for df in at.dataframe}
+    scenario = next(t for cols, t in tables.items() if "All-in Cost" in cols)
+    annual = next(t for cols, t in tables.items() if "Annual Payment" in cols)
+    assert scenario["Total Interest"].dtype.kind == "f"
+    assert annual["Ending Balance"].dtype.kind == "f"